@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Shared bodies of the GoByte NumPy examples.
+
+The example scripts are thin wrappers around these functions, so running
+several examples in one interpreter reuses the caches in utils.py.
+"""
+
+import sys
+
+import numpy as np
+
+from utils import EMPTY_MAPPING, class_hist, load_class_mapping, load_packets_u8
+
+# Largest ID range decoded through a lookup table; sparser IDs use the dict.
+_MAX_LUT_SIZE = 1 << 16
+
+
+def _build_names_lut(class_map, unique_classes):
+    """
+    Build an ID -> name object array so labels decode with one gather.
+
+    unique_classes is the sorted ID array from class_hist, so the label
+    range is known without rescanning the labels. Returns None if any
+    mapped ID or label is negative, or if the IDs span more than
+    _MAX_LUT_SIZE values; callers then fall back to the dict.
+    """
+    sorted_ids = class_map.sorted_ids
+    if unique_classes.dtype.kind not in 'iu' or (sorted_ids.size and sorted_ids[0] < 0):
+        return None
+    max_id = int(sorted_ids[-1]) if sorted_ids.size else -1
+    if unique_classes.size:
+        if unique_classes[0] < 0:
+            return None
+        max_id = max(max_id, int(unique_classes[-1]))
+    if max_id >= _MAX_LUT_SIZE:
+        return None
+
+    names_lut = np.array([f"Unknown({i})" for i in range(max_id + 1)], dtype=object)
+    names_lut[sorted_ids] = class_map.sorted_names
+    return names_lut
+
+
+def _lookup_names(ids, class_map, names_lut):
+    """Resolve an array of class IDs to a list of names."""
+    if names_lut is not None:
+        return names_lut[ids].tolist()
+    return [class_map.id_to_name.get(i, f"Unknown({i})") for i in ids.tolist()]
+
+
+def run_basic(data_path, labels_path):
+    """
+    Example 1: Load the data and labels files and print basic information.
+
+    Args:
+        data_path: Path to the *_data.npy file
+        labels_path: Path to the *_labels.npy file
+    """
+    # Load data files
+    print("Loading NumPy files...")
+    data = load_packets_u8(data_path)
+    labels = load_packets_u8(labels_path)
+
+    # Show basic information
+    print(f"\nSuccessfully loaded!")
+    print(f"Data shape: {data.shape}")
+    print(f"Data dtype: {data.dtype}")
+    print(f"Labels shape: {labels.shape}")
+    print(f"Labels dtype: {labels.dtype}")
+    print(f"Unique class IDs: {class_hist(labels)[0]}")
+
+    # Show value ranges
+    print(f"\nData value range: [{data.min()}, {data.max()}]")
+    print(f"Labels value range: [{labels.min()}, {labels.max()}]")
+
+    # Show sample data
+    print(f"\nSample (first packet, first 20 bytes):")
+    print(f"   {data[0, :20]}")
+
+    print(f"\nSample labels (first 10):")
+    print(f"   {labels[:10]}")
+
+
+def run_classes(data_path, labels_path, classes_path):
+    """
+    Example 2: Use the classes.json file to map integer labels to names.
+
+    Args:
+        data_path: Path to the *_data.npy file
+        labels_path: Path to the *_labels.npy file
+        classes_path: Path to the *_classes.json file
+    """
+    # Load data
+    data = load_packets_u8(data_path)
+    labels = load_packets_u8(labels_path)
+
+    # Load class mapping
+    class_map = load_class_mapping(classes_path)
+
+    if class_map is EMPTY_MAPPING:
+        print("WARNING: No class mapping file found.")
+        print("   (This is normal if processing without class labels)")
+        return
+
+    print("Class Mapping:")
+    sys.stdout.write("".join(
+        f"  {class_id}: {class_name}\n"
+        for class_id, class_name in zip(class_map.sorted_ids.tolist(),
+                                        class_map.sorted_names.tolist())
+    ))
+
+    # Show class distribution
+    print("\nClass Distribution:")
+    unique_classes, counts = class_hist(labels)
+    names_lut = _build_names_lut(class_map, unique_classes)
+    percentages = counts.astype(np.float64) * (100.0 / max(labels.size, 1))
+    rows = [
+        f"  {class_id:2d}: {class_name:20s} - {count:10,} packets ({percentage:5.2f}%)\n"
+        for class_id, count, percentage, class_name in zip(
+            unique_classes.tolist(), counts.tolist(), percentages.tolist(),
+            _lookup_names(unique_classes, class_map, names_lut),
+        )
+    ]
+    sys.stdout.write("".join(rows))
+
+    # Example: Convert labels to class names
+    print("\nExample: Convert integer labels to class names")
+    sample_labels = labels[:10]
+    sample_names = _lookup_names(sample_labels, class_map, names_lut)
+    print(f"First 10 labels as integers: {sample_labels}")
+    print(f"First 10 labels as names:    {sample_names}")
+
+    # # Example: Get class ID from name
+    # print("\nExample: Get class ID from name")
+    # if 'Steam' in class_map.name_to_id:
+    #     steam_id = class_map.name_to_id['Steam']
+    #     print(f"'Steam' maps to class ID: {steam_id}")
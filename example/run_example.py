@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Run one or more GoByte NumPy examples in a single process.
+
+Usage:
+    python3 run_example.py --which basic classes --prefix output_
+"""
+
+import argparse
+import os
+
+from _common import run_basic, run_classes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run GoByte NumPy examples")
+    parser.add_argument('--which', nargs='+', choices=['basic', 'classes'],
+                        default=['basic', 'classes'],
+                        help="Examples to run (default: both)")
+    parser.add_argument('--prefix', default='output_',
+                        help="Output file prefix (default: output_)")
+    parser.add_argument('--dir', default='../output',
+                        help="Directory containing GoByte output (default: ../output)")
+    args = parser.parse_args()
+
+    base = os.path.join(args.dir, args.prefix)
+    for i, which in enumerate(args.which):
+        if i > 0:
+            print()
+        if which == 'basic':
+            run_basic(f"{base}data.npy", f"{base}labels.npy")
+        else:
+            run_classes(f"{base}data.npy", f"{base}labels.npy", f"{base}classes.json")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Helpers for loading GoByte NumPy output files.
+
+The loaders memory-map the array payload instead of reading it into RAM,
+so only the slices that are actually accessed are paged in from disk.
+Loaded arrays and class mappings are cached per process, keyed by the
+file's absolute path, mtime and size.
+"""
+
+import ast
+import os
+import pickle
+import re
+import struct
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Matches the fixed-schema header dict written by NumPy and GoByte.
+_HEADER_RE = re.compile(
+    rb"'descr':\s*'([^']+)'.*?'fortran_order':\s*(True|False).*?'shape':\s*\(([^)]*)\)",
+    re.S,
+)
+
+# NumPy headers are padded to 64 bytes and are practically always this small.
+_HEADER_READ_SIZE = 65536
+
+# GoByte pads its headers to 128 bytes.
+_PACKET_HEADER_READ_SIZE = 128
+
+# classes.json files larger than this are streamed with ijson, if installed.
+_STREAM_JSON_MIN_BYTES = 1 << 20
+
+# Labels counted per np.bincount call, bounding its temporary intp copy.
+_COUNT_CHUNK_SIZE = 1 << 22
+
+
+def _file_key(filename):
+    """Return the (path, mtime, size) cache key for a file."""
+    path = os.path.abspath(filename)
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _readonly(arr):
+    """Mark an array read-only (it may be shared via a cache) and return it."""
+    arr.flags.writeable = False
+    return arr
+
+
+def load_npy(filename):
+    """
+    Load a .npy file as a read-only memory map.
+
+    Fixed-width dtypes are loaded with pickling disabled. Object arrays
+    are retried with pickling enabled and read fully into memory; other
+    files NumPy refuses fall back to manual header parsing. Results are
+    cached by absolute path, mtime and size, so a file is only re-opened
+    after it changes on disk.
+
+    Args:
+        filename: Path to .npy file
+
+    Returns:
+        np.ndarray: Read-only array, memory-mapped except for object dtypes
+    """
+    return _cached_load_npy(*_file_key(filename))
+
+
+@lru_cache(maxsize=16)
+def _cached_load_npy(path, mtime, size):
+    # The result is shared through the cache, so never hand out a
+    # writable array (the pickled and manual paths load into memory).
+    try:
+        return np.load(path, allow_pickle=False, mmap_mode='r')
+    except ValueError as e:
+        # Object arrays are pickled: retry with pickling, without mmap.
+        # NumPy reports them as either unpicklable or un-mappable.
+        if 'allow_pickle' in str(e) or 'Python objects' in str(e):
+            return _readonly(np.load(path, allow_pickle=True))
+        return _readonly(load_npy_manual(path))
+    except (OSError, EOFError, NotImplementedError):
+        return _readonly(load_npy_manual(path))
+
+
+def load_npy_manual(filename):
+    """
+    Parse a .npy file header by hand and memory-map the payload.
+
+    Object-dtype payloads are unpickled into memory, so only use this on
+    trusted files.
+
+    Args:
+        filename: Path to .npy file
+
+    Returns:
+        np.ndarray: Memory-mapped (read-only) array, or an in-memory array
+        for object dtypes and empty arrays
+    """
+    with open(filename, 'rb') as f:
+        header_bytes, data_start = _read_header(f, filename, _HEADER_READ_SIZE)
+        descr, fortran_order, shape = _parse_header(header_bytes)
+
+        dtype = _dtype(descr) if isinstance(descr, str) else np.dtype(descr)
+        order = 'F' if fortran_order else 'C'
+        count = int(np.prod(shape))
+
+        f.seek(data_start)
+
+        # Object arrays are stored as a pickled ndarray after the header.
+        if dtype.hasobject:
+            return pickle.load(f)
+
+        # Empty arrays cannot be memory-mapped.
+        if count == 0:
+            return np.fromfile(f, dtype=dtype).reshape(shape, order=order)
+
+        return np.memmap(filename, dtype=dtype, mode='r',
+                         offset=data_start, shape=shape, order=order)
+
+
+def load_packets_u8(filename):
+    """
+    Memory-map a GoByte uint8 packet/label file without generic parsing.
+
+    GoByte always writes C-ordered '|u1' arrays, so only the shape needs
+    to be read from the header. Files that do not match that layout (or
+    are empty) are loaded with load_npy instead. Results are cached like
+    load_npy.
+
+    Args:
+        filename: Path to .npy file written by GoByte
+
+    Returns:
+        np.ndarray: Memory-mapped (read-only) uint8 array for GoByte files;
+        otherwise whatever load_npy returns (any dtype, read-only, and in
+        memory for empty or object arrays)
+    """
+    return _cached_load_packets_u8(*_file_key(filename))
+
+
+@lru_cache(maxsize=16)
+def _cached_load_packets_u8(path, mtime, size):
+    with open(path, 'rb') as f:
+        header_bytes, data_start = _read_header(f, path, _PACKET_HEADER_READ_SIZE)
+
+    match = _HEADER_RE.search(header_bytes)
+    if match and match.group(1) == b'|u1' and match.group(2) == b'False':
+        shape = _parse_shape(match.group(3))
+        if int(np.prod(shape)) > 0:
+            return np.memmap(path, dtype=np.uint8, mode='r',
+                             offset=data_start, shape=shape)
+
+    return load_npy(path)
+
+
+def _read_header(f, filename, read_size):
+    """
+    Read the raw header dict bytes from an open .npy file.
+
+    The first read_size bytes are read in one call and sliced in memory;
+    longer headers are completed with a second read.
+
+    Returns:
+        tuple: (header dict bytes, payload offset)
+    """
+    head = f.read(read_size)
+    if len(head) < 12 or head[:6] != b'\x93NUMPY':
+        raise ValueError(f"Not a NumPy file: {filename}")
+
+    major = head[6]
+    if major == 1:
+        header_len = struct.unpack_from('<H', head, 8)[0]
+        header_start = 10
+    else:
+        header_len = struct.unpack_from('<I', head, 8)[0]
+        header_start = 12
+
+    header_end = header_start + header_len
+    header_bytes = head[header_start:header_end]
+    if header_end > len(head):
+        header_bytes += f.read(header_end - len(head))
+    return header_bytes, header_end
+
+
+@lru_cache(maxsize=64)
+def _dtype(descr):
+    """Return the (memoized) np.dtype for a descr string."""
+    return np.dtype(descr)
+
+
+def _parse_header(header_bytes):
+    """
+    Parse a .npy header dict into (descr, fortran_order, shape).
+
+    Uses a precompiled regex for the common case and falls back to
+    ast.literal_eval for headers it does not match (e.g. structured dtypes).
+    """
+    match = _HEADER_RE.search(header_bytes)
+    if match:
+        descr, fortran_order, shape_str = match.groups()
+        return descr.decode('latin1'), fortran_order == b'True', _parse_shape(shape_str)
+
+    header_dict = ast.literal_eval(header_bytes.decode('latin1'))
+    return header_dict['descr'], header_dict['fortran_order'], tuple(header_dict['shape'])
+
+
+def _parse_shape(shape_str):
+    """Parse the inside of a shape tuple, e.g. b'12, 1500' or b'12,'."""
+    return tuple(int(dim) for dim in shape_str.split(b',') if dim.strip())
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _class_counts(labels, n_classes):
+        counts = np.zeros(n_classes, np.intp)
+        for i in range(labels.shape[0]):
+            counts[labels[i]] += 1
+        return counts
+else:
+    def _class_counts(labels, n_classes):
+        # Count in slices so bincount's intp cast never copies the whole
+        # (possibly memory-mapped) label array at once.
+        counts = np.zeros(n_classes, np.intp)
+        for start in range(0, labels.size, _COUNT_CHUNK_SIZE):
+            counts += np.bincount(labels[start:start + _COUNT_CHUNK_SIZE],
+                                  minlength=n_classes)
+        return counts
+
+
+def class_hist(labels):
+    """
+    Count occurrences of each class ID in a label array.
+
+    Integer labels are first scanned once for their min/max. If all IDs are
+    small and non-negative they are then counted in one histogram pass
+    (with a Numba kernel if Numba is installed, np.bincount otherwise);
+    anything else falls back to np.unique.
+
+    Args:
+        labels: 1-D array of class IDs
+
+    Returns:
+        tuple: (sorted unique class IDs with the labels' dtype, intp counts
+        per ID)
+    """
+    if labels.dtype.kind in 'iu':
+        if labels.size == 0:
+            lo, hi = 0, -1
+        else:
+            # Unsigned labels cannot be negative, so skip the min() pass.
+            lo = labels.min() if labels.dtype.kind == 'i' else 0
+            hi = labels.max()
+        if lo >= 0 and hi < 1 << 20:
+            counts = _class_counts(np.asarray(labels), int(hi) + 1)
+            ids = np.flatnonzero(counts)
+            return ids.astype(labels.dtype), counts[ids]
+
+    return np.unique(labels, return_counts=True)
+
+
+class ClassMap(NamedTuple):
+    """Class mapping loaded from a classes.json file."""
+
+    id_to_name: MappingProxyType
+    name_to_id: MappingProxyType
+    sorted_ids: np.ndarray
+    sorted_names: np.ndarray
+
+
+# Returned for missing classes.json files, so that path allocates nothing.
+EMPTY_MAPPING = ClassMap(MappingProxyType({}), MappingProxyType({}),
+                         _readonly(np.empty(0, np.int64)),
+                         _readonly(np.empty(0, object)))
+
+
+def load_class_mapping(classes_file):
+    """
+    Load class ID to name mapping from JSON file.
+
+    Results are cached by absolute path, mtime and size. The returned
+    mappings are read-only views of the cached dicts, and sorted_ids /
+    sorted_names are read-only parallel arrays ordered by class ID.
+
+    Args:
+        classes_file: Path to classes.json file
+
+    Returns:
+        ClassMap: (id_to_name, name_to_id, sorted_ids, sorted_names), or
+        EMPTY_MAPPING if the file does not exist
+    """
+    if not os.path.exists(classes_file):
+        return EMPTY_MAPPING
+
+    return _cached_load_class_mapping(*_file_key(classes_file))
+
+
+@lru_cache(maxsize=16)
+def _cached_load_class_mapping(path, mtime, size):
+    with open(path, 'rb') as f:
+        # Stream very large mappings instead of materializing the whole dict.
+        if ijson is not None and size > _STREAM_JSON_MIN_BYTES:
+            items = ijson.kvitems(f, '')
+        else:
+            items = _json.loads(f.read()).items()
+
+        id_to_name = {}
+        name_to_id = {}
+        for k, v in items:
+            class_id = int(k)
+            id_to_name[class_id] = v
+            name_to_id[v] = class_id
+
+    sorted_ids = _readonly(np.array(sorted(id_to_name), dtype=np.int64))
+    sorted_names = _readonly(
+        np.array([id_to_name[i] for i in sorted_ids.tolist()], dtype=object)
+    )
+
+    return ClassMap(MappingProxyType(id_to_name), MappingProxyType(name_to_id),
+                    sorted_ids, sorted_names)